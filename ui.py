@@ -1,13 +1,24 @@
+import contextlib
 import csv
-import statistics
+import gzip
+import hashlib
+import math
+import os
+import tempfile
+import zipfile
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Set
-
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import IO, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pac
 from PyQt5.QtChart import QChart, QChartView, QLineSeries, QScatterSeries, QValueAxis
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QBrush, QColor, QPen
+from PyQt5.QtCore import QObject, QPointF, QRunnable, Qt, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QPen, QPolygonF
 from PyQt5.QtWidgets import (
     QFileDialog,
     QLabel,
@@ -18,14 +29,109 @@ from PyQt5.QtWidgets import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class GlucoseData:
-    glucose_values: List[int]
-    dates: Set[date]
+    # Readings in mg/dL as int16; sensors report roughly 40-500 mg/dL.
+    glucose_values: np.ndarray
+    # Distinct days with readings, as days since the Unix epoch.
+    days: np.ndarray
+    glucose_sum: int
+    glucose_sum_sq: int
+    min_glucose: int
+    max_glucose: int
     high_glucose_count: int
     high_glucose_periods: int
 
 
+LIBRE_TIMESTAMP_FORMATS = ("%m-%d-%Y %I:%M %p", "%m/%d/%Y %H:%M", "%m/%d/%y %H:%M")
+
+# Index into LIBRE_TIMESTAMP_FORMATS of the format that matched last time;
+# exports almost always use a single format, so it is tried first.
+_libre_format_hint = [0]
+
+
+def _parse_libre_timestamps(raw: pd.Series) -> pd.Series:
+    order = sorted(
+        range(len(LIBRE_TIMESTAMP_FORMATS)), key=lambda i: i != _libre_format_hint[0]
+    )
+    timestamps = pd.Series(pd.NaT, index=raw.index, dtype="datetime64[s]")
+    for i in order:
+        missing = timestamps.isna()
+        if not missing.any():
+            break
+        parsed = pd.to_datetime(
+            raw[missing], format=LIBRE_TIMESTAMP_FORMATS[i], errors="coerce", cache=True
+        )
+        if parsed.notna().any():
+            _libre_format_hint[0] = i
+            timestamps[missing] = parsed
+    return timestamps
+
+
+def _to_epoch_seconds(timestamps: np.ndarray) -> np.ndarray:
+    return timestamps.astype("datetime64[s]").astype(np.int64)
+
+
+def _scan_readings(values: np.ndarray, times: np.ndarray) -> Tuple[int, ...]:
+    # Returns (sum, sum of squares, min, max, spike count, spike periods).
+    # Readings >= 140 mg/dL count as spikes; consecutive spikes form one
+    # period unless an hour or more passes between them.
+    if values.size == 0:
+        return 0, 0, 0, 0, 0, 0
+
+    wide = values.astype(np.int64)
+    high = values >= 140
+    prev_high = np.concatenate(([False], high[:-1]))
+    gap = np.diff(times, prepend=times[0])
+    starts = high & (~prev_high | (gap >= 3600))
+    return (
+        int(wide.sum()),
+        int(wide @ wide),
+        int(values.min()),
+        int(values.max()),
+        int(high.sum()),
+        int(starts.sum()),
+    )
+
+
+def _build_glucose_data(glucose: pd.Series, timestamps: pd.Series) -> GlucoseData:
+    valid = glucose.notna() & timestamps.notna()
+    skipped = int((~valid).sum())
+    if skipped:
+        print(f"Skipped {skipped} rows with missing glucose or timestamp.")
+    glucose = glucose[valid].astype("int16")
+    timestamps = timestamps[valid]
+
+    values = glucose.to_numpy(np.int16)
+    times = _to_epoch_seconds(timestamps.to_numpy())
+    (
+        glucose_sum,
+        glucose_sum_sq,
+        min_glucose,
+        max_glucose,
+        high_glucose_count,
+        high_glucose_periods,
+    ) = _scan_readings(values, times)
+
+    return GlucoseData(
+        glucose_values=values,
+        days=np.unique(times // 86400).astype(np.int32),
+        glucose_sum=glucose_sum,
+        glucose_sum_sq=glucose_sum_sq,
+        min_glucose=min_glucose,
+        max_glucose=max_glucose,
+        high_glucose_count=high_glucose_count,
+        high_glucose_periods=high_glucose_periods,
+    )
+
+
+def _open_csv(file_path: str) -> IO[str]:
+    # pyarrow decompresses .gz exports itself; this covers the header pre-scan.
+    if file_path.endswith(".gz"):
+        return gzip.open(file_path, "rt", newline="")
+    return open(file_path, newline="")
+
+
 class CGMParser(ABC):
     @abstractmethod
     def parse(self, file_path: str) -> GlucoseData:
@@ -34,137 +140,184 @@ class CGMParser(ABC):
 
 class LibreParser(CGMParser):
     def parse(self, file_path: str) -> GlucoseData:
-        glucose_values = []
-        dates = set()
-        high_glucose_count = 0
-        high_glucose_periods = 0
-        in_high_glucose_period = False
-        last_high_glucose_time = None
-
-        skip = True
-        header = None
-
-        with open(file_path, newline="") as csvfile:
-            for row in csv.reader(csvfile):
-                if row[0] == "Device":
-                    skip = False
-                    header = row
-                elif not skip:
-                    data_dict = {header[i]: row[i] for i in range(len(header))}
-
-                    if data_dict.get("Record Type", None) != "0":
-                        continue
-
-                    historic_glucose_value = data_dict.get(
-                        "Historic Glucose mg/dL", None
-                    )
-                    scan_glucose_value = data_dict.get("Scan Glucose mg/dL", None)
-                    glucose_value = historic_glucose_value or scan_glucose_value
-                    try:
-                        glucose_value_int = int(glucose_value)
-                        glucose_values.append(glucose_value_int)
-
-                        try:
-                            current_time = datetime.strptime(
-                                data_dict["Device Timestamp"], "%m-%d-%Y %I:%M %p"
-                            )
-                        except ValueError:
-                            try:
-                                current_time = datetime.strptime(
-                                    data_dict["Device Timestamp"], "%m/%d/%Y %H:%M"
-                                )
-                            except ValueError:
-                                try:
-                                    current_time = datetime.strptime(
-                                        data_dict["Device Timestamp"], "%m/%d/%y %H:%M"
-                                    )
-                                except ValueError as e:
-                                    print(
-                                        f"Could not parse timestamp '{data_dict['Device Timestamp']}': {e}"
-                                    )
-                                    continue
-
-                        dates.add(current_time.date())
-
-                        if glucose_value_int >= 140:
-                            high_glucose_count += 1
-                            if not in_high_glucose_period or (
-                                last_high_glucose_time
-                                and current_time - last_high_glucose_time
-                                >= timedelta(hours=1)
-                            ):
-                                high_glucose_periods += 1
-                                in_high_glucose_period = True
-                            last_high_glucose_time = current_time
-                        else:
-                            in_high_glucose_period = False
-
-                    except (ValueError, TypeError) as e:
-                        print(f"Error processing row: {e}. Skipping this row.")
-                        continue
-
-        return GlucoseData(
-            glucose_values=glucose_values,
-            dates=dates,
-            high_glucose_count=high_glucose_count,
-            high_glucose_periods=high_glucose_periods,
+        with _open_csv(file_path) as csvfile:
+            for header_offset, row in enumerate(csv.reader(csvfile)):
+                if row and row[0] == "Device":
+                    break
+            else:
+                raise ValueError(f"No 'Device' header row found in {file_path}")
+
+        table = pac.read_csv(
+            file_path,
+            read_options=pac.ReadOptions(skip_rows=header_offset),
+            convert_options=pac.ConvertOptions(
+                include_columns=[
+                    "Device Timestamp",
+                    "Record Type",
+                    "Historic Glucose mg/dL",
+                    "Scan Glucose mg/dL",
+                ],
+                column_types={
+                    "Device Timestamp": pa.string(),
+                    "Record Type": pa.int8(),
+                    "Historic Glucose mg/dL": pa.float64(),
+                    "Scan Glucose mg/dL": pa.float64(),
+                },
+            ),
         )
+        # Only historic/scan glucose records (type 0) are used; drop the rest
+        # before any other column is touched.
+        table = table.filter(pc.equal(table["Record Type"], 0))
+        df = table.to_pandas()
+
+        glucose = df["Historic Glucose mg/dL"].fillna(df["Scan Glucose mg/dL"])
+        timestamps = _parse_libre_timestamps(df["Device Timestamp"])
+
+        return _build_glucose_data(glucose, timestamps)
 
 
 class DexcomParser(CGMParser):
     def parse(self, file_path: str) -> GlucoseData:
-        glucose_values = []
-        dates = set()
-        high_glucose_count = 0
-        high_glucose_periods = 0
-        in_high_glucose_period = False
-        last_high_glucose_time = None
-
-        with open(file_path, newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                if row["Event Type"] != "EGV":
-                    continue
-
-                glucose_value = row["Glucose Value (mg/dL)"]
-                try:
-                    glucose_value_int = int(glucose_value)
-                    glucose_values.append(glucose_value_int)
-
-                    current_time = datetime.fromisoformat(
-                        row["Timestamp (YYYY-MM-DDThh:mm:ss)"]
-                    )
-                    dates.add(current_time.date())
-
-                    if glucose_value_int >= 140:
-                        high_glucose_count += 1
-                        if not in_high_glucose_period or (
-                            last_high_glucose_time
-                            and current_time - last_high_glucose_time
-                            >= timedelta(hours=1)
-                        ):
-                            high_glucose_periods += 1
-                            in_high_glucose_period = True
-                        last_high_glucose_time = current_time
-                    else:
-                        in_high_glucose_period = False
-
-                except ValueError as e:
-                    print(f"Error processing row: {e}. Skipping this row.")
-                    continue
-
-        return GlucoseData(
-            glucose_values=glucose_values,
-            dates=dates,
-            high_glucose_count=high_glucose_count,
-            high_glucose_periods=high_glucose_periods,
+        table = pac.read_csv(
+            file_path,
+            convert_options=pac.ConvertOptions(
+                include_columns=[
+                    "Event Type",
+                    "Glucose Value (mg/dL)",
+                    "Timestamp (YYYY-MM-DDThh:mm:ss)",
+                ],
+                column_types={
+                    "Event Type": pa.string(),
+                    "Glucose Value (mg/dL)": pa.string(),
+                    "Timestamp (YYYY-MM-DDThh:mm:ss)": pa.string(),
+                },
+            ),
         )
+        table = table.filter(pc.equal(table["Event Type"], "EGV"))
+        df = table.to_pandas()
+
+        # Out-of-range readings are exported as "High"/"Low" and are skipped.
+        glucose = pd.to_numeric(df["Glucose Value (mg/dL)"], errors="coerce")
+        timestamps = pd.to_datetime(
+            df["Timestamp (YYYY-MM-DDThh:mm:ss)"],
+            format="ISO8601",
+            errors="coerce",
+            cache=True,
+        )
+
+        return _build_glucose_data(glucose, timestamps)
+
+
+# Bump whenever the GlucoseData fields change so stale cache files are ignored.
+_CACHE_VERSION = 3
+
+
+def _cache_path(file_path: str, parser: CGMParser) -> Path:
+    stat = os.stat(file_path)
+    key = hashlib.sha1(
+        f"{_CACHE_VERSION}|{os.path.abspath(file_path)}|{stat.st_mtime_ns}|"
+        f"{stat.st_size}|{type(parser).__name__}".encode()
+    ).hexdigest()
+    return Path(tempfile.gettempdir()) / f"cgm-{key}.npz"
+
+
+def _load_cached(cache_path: Path) -> Optional[GlucoseData]:
+    try:
+        with np.load(cache_path) as cached:
+            values = {f.name: cached[f.name] for f in fields(GlucoseData)}
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+        # Damaged or outdated; remove it so the next parse rewrites it.
+        with contextlib.suppress(OSError):
+            cache_path.unlink(missing_ok=True)
+        return None
+
+    for name, value in values.items():
+        if value.ndim == 0:
+            values[name] = value.item()
+    return GlucoseData(**values)
+
+
+def _save_cached(cache_path: Path, data: GlucoseData):
+    values = {f.name: getattr(data, f.name) for f in fields(GlucoseData)}
+    # Write to a sibling temp file and rename it into place so an interrupted
+    # write never leaves a truncated cache file behind.
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".npz.tmp")
+    except OSError as e:
+        print(f"Could not write cache file '{cache_path}': {e}")
+        return
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            np.savez_compressed(tmp_file, **values)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        Path(tmp_path).unlink(missing_ok=True)
+        print(f"Could not write cache file '{cache_path}': {e}")
+
+
+def _parse_with_cache(parser: CGMParser, file_path: str) -> GlucoseData:
+    cache_path = _cache_path(file_path, parser)
+    data = _load_cached(cache_path)
+    if data is None:
+        data = parser.parse(file_path)
+        _save_cached(cache_path, data)
+    return data
+
+
+def _to_polygon(x: np.ndarray, y: np.ndarray) -> QPolygonF:
+    # Fill the QPolygonF's own storage (pairs of qreal) from NumPy instead of
+    # constructing a QPointF per point.
+    polygon = QPolygonF()
+    if x.size == 0:
+        return polygon
+    polygon.fill(QPointF(), x.size)
+    buffer = polygon.data()
+    buffer.setsize(x.size * 2 * np.dtype(np.float64).itemsize)
+    points = np.frombuffer(buffer, np.float64).reshape(x.size, 2)
+    points[:, 0] = x
+    points[:, 1] = y
+    return polygon
+
+
+# Points for a metric below the first threshold, below the second, or above.
+_GRADE_POINTS = np.array([4, 3, 2])
+_AVG_GLUCOSE_THRESHOLDS = np.array([100, 110])
+_STD_DEV_THRESHOLDS = np.array([15, 20])
+_SPIKES_PER_DAY_THRESHOLDS = np.array([1, 2])
+
+# Minimum point totals for each grade after "C".
+_GRADE_THRESHOLDS = np.array([8, 9, 11, 12])
+_GRADES = ("C", "B-", "B", "B+", "A")
+
+
+class ParseSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class ParseWorker(QRunnable):
+    def __init__(self, parser: CGMParser, file_path: str):
+        super().__init__()
+        self.parser = parser
+        self.file_path = file_path
+        self.signals = ParseSignals()
+
+    def run(self):
+        try:
+            glucose_data = _parse_with_cache(self.parser, self.file_path)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(glucose_data)
 
 
 class CGMAnalyzer(QWidget):
     def __init__(self):
         super().__init__()
         self.file_path = None
+        self.parse_worker = None
         self.parsers = {
             "libre": LibreParser(),
             "dexcom": DexcomParser(),
@@ -194,7 +347,8 @@ class CGMAnalyzer(QWidget):
         self.analyze_button.clicked.connect(self.analyze_data)
         layout.addWidget(self.analyze_button)
 
-        self.chart_view = QChartView()
+        self.setup_chart()
+        self.chart_view = QChartView(self.chart)
         layout.addWidget(self.chart_view)
 
         self.result_label = QLabel()
@@ -202,10 +356,49 @@ class CGMAnalyzer(QWidget):
 
         self.setLayout(layout)
 
+    def setup_chart(self):
+        self.chart = QChart()
+        self.chart.legend().hide()
+
+        self.axisX = QValueAxis()
+        self.axisX.setTitleText("Time")
+        self.chart.addAxis(self.axisX, Qt.AlignBottom)
+
+        self.axisY = QValueAxis()
+        self.axisY.setTitleText("Blood Glucose (mg/dL)")
+        self.chart.addAxis(self.axisY, Qt.AlignLeft)
+
+        self.main_series = QLineSeries()
+
+        self.avg_series = QLineSeries()
+        self.avg_series.setPen(QPen(QColor("red"), 2, Qt.DotLine))
+
+        self.std_upper_series = QLineSeries()
+        self.std_upper_series.setPen(QPen(QColor("black"), 1, Qt.DotLine))
+
+        self.std_lower_series = QLineSeries()
+        self.std_lower_series.setPen(QPen(QColor("black"), 1, Qt.DotLine))
+
+        self.spike_series = QScatterSeries()
+        self.spike_series.setMarkerShape(QScatterSeries.MarkerShapeCircle)
+        self.spike_series.setMarkerSize(8.0)
+        self.spike_series.setBrush(QBrush(QColor("black")))
+
+        for series in (
+            self.main_series,
+            self.avg_series,
+            self.std_upper_series,
+            self.std_lower_series,
+            self.spike_series,
+        ):
+            self.chart.addSeries(series)
+            series.attachAxis(self.axisX)
+            series.attachAxis(self.axisY)
+
     def select_file(self):
         options = QFileDialog.Options()
         self.file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select CSV File", "", "CSV Files (*.csv)", options=options
+            self, "Select CSV File", "", "CSV Files (*.csv *.csv.gz)", options=options
         )
 
     def get_active_parser(self) -> Optional[CGMParser]:
@@ -224,26 +417,46 @@ class CGMAnalyzer(QWidget):
             print("Please select a CGM type")
             return
 
+        self.analyze_button.setEnabled(False)
+        # Keep a reference so the worker's signals outlive the pool's run().
+        self.parse_worker = ParseWorker(parser, self.file_path)
+        self.parse_worker.signals.finished.connect(self._on_parsed)
+        self.parse_worker.signals.error.connect(self._on_parse_error)
+        QThreadPool.globalInstance().start(self.parse_worker)
+
+    def _on_parsed(self, glucose_data: GlucoseData):
+        self.parse_worker = None
+        self.analyze_button.setEnabled(True)
         try:
-            glucose_data = parser.parse(self.file_path)
             metrics = self.calculate_metrics(glucose_data)
             self.plot_data(glucose_data, metrics)
             self.display_results(metrics)
         except Exception as e:
             print(f"Error analyzing data: {e}")
 
+    def _on_parse_error(self, message: str):
+        self.parse_worker = None
+        self.analyze_button.setEnabled(True)
+        print(f"Error analyzing data: {message}")
+
     def calculate_metrics(self, data: GlucoseData) -> Dict:
-        if not data.glucose_values:
+        count = data.glucose_values.size
+        if count == 0:
             return {}
 
-        total_glucose = sum(data.glucose_values)
-        count = len(data.glucose_values)
-        average_glucose = round(total_glucose / count, 1) if count > 0 else 0
+        average_glucose = round(data.glucose_sum / count, 1)
         glucose_std_dev = (
-            round(statistics.stdev(data.glucose_values), 1) if count > 1 else 0
+            round(
+                math.sqrt(
+                    (data.glucose_sum_sq - data.glucose_sum**2 / count) / (count - 1)
+                ),
+                1,
+            )
+            if count > 1
+            else 0
         )
 
-        total_days = len(data.dates)
+        total_days = data.days.size
         average_spike_periods_per_day = round(
             data.high_glucose_periods / total_days if total_days else 0, 2
         )
@@ -263,113 +476,47 @@ class CGMAnalyzer(QWidget):
     def calculate_grade(
         self, avg_glucose: float, std_dev: float, spikes_per_day: float
     ) -> str:
-        grade_tot = 0
-
-        if avg_glucose < 100:
-            grade_tot += 4
-        elif avg_glucose < 110:
-            grade_tot += 3
-        elif avg_glucose >= 110:
-            grade_tot += 2
-
-        if std_dev < 15:
-            grade_tot += 4
-        elif std_dev < 20:
-            grade_tot += 3
-        elif std_dev >= 20:
-            grade_tot += 2
-
-        if spikes_per_day < 1:
-            grade_tot += 4
-        elif spikes_per_day < 2:
-            grade_tot += 3
-        elif spikes_per_day >= 2:
-            grade_tot += 2
-
-        if grade_tot >= 12:
-            return "A"
-        elif grade_tot >= 11:
-            return "B+"
-        elif grade_tot >= 9:
-            return "B"
-        elif grade_tot >= 8:
-            return "B-"
-        else:
-            return "C"
+        grade_tot = sum(
+            int(_GRADE_POINTS[np.searchsorted(thresholds, value, side="right")])
+            for thresholds, value in (
+                (_AVG_GLUCOSE_THRESHOLDS, avg_glucose),
+                (_STD_DEV_THRESHOLDS, std_dev),
+                (_SPIKES_PER_DAY_THRESHOLDS, spikes_per_day),
+            )
+        )
+        return _GRADES[np.searchsorted(_GRADE_THRESHOLDS, grade_tot, side="right")]
 
     def plot_data(
         self,
         data: GlucoseData,
         metrics: Dict,
     ):
-        series = QLineSeries()
-        for i, g in enumerate(data.glucose_values):
-            series.append(i, g)
+        values = data.glucose_values
+        min_time = 0
+        max_time = values.size - 1
+        average = metrics["average_glucose"]
+        std_dev = metrics["glucose_std_dev"]
 
-        chart = QChart()
-        chart.addSeries(series)
-        chart.legend().hide()
+        self.main_series.replace(_to_polygon(np.arange(values.size), values))
 
-        axisX = QValueAxis()
-        axisX.setTitleText("Time")
-        min_time = 0
-        max_time = len(data.glucose_values) - 1
-        axisX.setRange(min_time, max_time)
-        chart.addAxis(axisX, Qt.AlignBottom)
-        series.attachAxis(axisX)
-
-        axisY = QValueAxis()
-        axisY.setTitleText("Blood Glucose (mg/dL)")
-        min_glucose = min(data.glucose_values)
-        max_glucose = max(data.glucose_values)
-        axisY.setRange(min_glucose - 10, max_glucose + 10)
-        chart.addAxis(axisY, Qt.AlignLeft)
-        series.attachAxis(axisY)
-
-        avg_series = QLineSeries()
-        avg_series.append(min_time, metrics["average_glucose"])
-        avg_series.append(max_time, metrics["average_glucose"])
-        avg_series.setPen(QPen(QColor("red"), 2, Qt.DotLine))
-        chart.addSeries(avg_series)
-        avg_series.attachAxis(axisX)
-        avg_series.attachAxis(axisY)
-
-        std_upper_series = QLineSeries()
-        std_upper_series.append(
-            min_time, metrics["average_glucose"] + metrics["glucose_std_dev"] / 2
-        )
-        std_upper_series.append(
-            max_time, metrics["average_glucose"] + metrics["glucose_std_dev"] / 2
+        self.avg_series.replace(
+            [QPointF(min_time, average), QPointF(max_time, average)]
         )
-        std_upper_series.setPen(QPen(QColor("black"), 1, Qt.DotLine))
-        chart.addSeries(std_upper_series)
-        std_upper_series.attachAxis(axisX)
-        std_upper_series.attachAxis(axisY)
-
-        std_lower_series = QLineSeries()
-        std_lower_series.append(
-            min_time, metrics["average_glucose"] - metrics["glucose_std_dev"]
+        self.std_upper_series.replace(
+            [
+                QPointF(min_time, average + std_dev / 2),
+                QPointF(max_time, average + std_dev / 2),
+            ]
         )
-        std_lower_series.append(
-            max_time, metrics["average_glucose"] - metrics["glucose_std_dev"]
+        self.std_lower_series.replace(
+            [QPointF(min_time, average - std_dev), QPointF(max_time, average - std_dev)]
         )
-        std_lower_series.setPen(QPen(QColor("black"), 1, Qt.DotLine))
-        chart.addSeries(std_lower_series)
-        std_lower_series.attachAxis(axisX)
-        std_lower_series.attachAxis(axisY)
-
-        spike_series = QScatterSeries()
-        for i, g in enumerate(data.glucose_values):
-            if g >= 140:
-                spike_series.append(i, g)
-        spike_series.setMarkerShape(QScatterSeries.MarkerShapeCircle)
-        spike_series.setMarkerSize(8.0)
-        spike_series.setBrush(QBrush(QColor("black")))
-        chart.addSeries(spike_series)
-        spike_series.attachAxis(axisX)
-        spike_series.attachAxis(axisY)
-
-        self.chart_view.setChart(chart)
+
+        spike_idx = np.flatnonzero(values >= 140)
+        self.spike_series.replace(_to_polygon(spike_idx, values[spike_idx]))
+
+        self.axisX.setRange(min_time, max_time)
+        self.axisY.setRange(data.min_glucose - 10, data.max_glucose + 10)
 
     def display_results(
         self,